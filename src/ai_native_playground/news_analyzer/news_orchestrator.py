@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
 import argparse
+import itertools
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
+from urllib.parse import urlparse
 from .news_agent import NewsAgent
 from .summarizer_agent import SummarizerAgent
 
 class NewsOrchestrator:
     def __init__(self):
-        self.news_agent = None
         self.summarizer = SummarizerAgent()
     
     def run_news_analysis(self, news_sources: List[str], max_headlines: int = 10, save_to_file: bool = False) -> Dict:
@@ -16,12 +18,20 @@ class NewsOrchestrator:
         
         all_headlines = []
         
-        for source_url in news_sources:
+        sources_by_host = {}
+        for index, source_url in enumerate(news_sources):
             print(f"📰 Fetching from: {source_url}")
-            self.news_agent = NewsAgent(source_url)
-            headlines = self.news_agent.fetch_headlines(max_headlines)
-            all_headlines.extend(headlines)
-            time.sleep(1)
+            sources_by_host.setdefault(urlparse(source_url).netloc, []).append((index, source_url))
+        
+        if sources_by_host:
+            headlines_by_source = [[] for _ in news_sources]
+            with ThreadPoolExecutor(max_workers=min(len(sources_by_host), 8)) as executor:
+                results = executor.map(self._fetch_host, sources_by_host.values(), itertools.repeat(max_headlines))
+                for host_results in results:
+                    for index, headlines in host_results:
+                        headlines_by_source[index] = headlines
+            for headlines in headlines_by_source:
+                all_headlines.extend(headlines)
         
         print(f"\n📊 Total headlines collected: {len(all_headlines)}")
         
@@ -46,6 +56,15 @@ class NewsOrchestrator:
             'summary': summary_data,
             'report': detailed_report
         }
+    
+    def _fetch_host(self, sources: List[Tuple[int, str]], max_headlines: int) -> List[Tuple[int, List[Dict]]]:
+        results = []
+        for i, (index, source_url) in enumerate(sources):
+            if i > 0:
+                time.sleep(1)
+            news_agent = NewsAgent(source_url)
+            results.append((index, news_agent.fetch_headlines(max_headlines)))
+        return results
 
 def main():
     parser = argparse.ArgumentParser(description="News Analysis Orchestrator - Fetch and Summarize Headlines")
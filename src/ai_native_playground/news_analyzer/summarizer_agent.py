@@ -2,17 +2,27 @@ from typing import List, Dict
 import re
 from collections import Counter
 
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'can', 'may', 'might', 'must', 'this', 'that', 'these', 'those', 'i',
+    'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my',
+    'your', 'his', 'her', 'its', 'our', 'their'
+})
+
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+TECH_KEYWORDS = ('ai', 'tech', 'software', 'app', 'data', 'api', 'cloud', 'startup')
+BUSINESS_KEYWORDS = ('company', 'market', 'stock', 'investment', 'business', 'ceo')
+
+TECH_PATTERN = re.compile('|'.join(map(re.escape, TECH_KEYWORDS)))
+BUSINESS_PATTERN = re.compile('|'.join(map(re.escape, BUSINESS_KEYWORDS)))
+
 class SummarizerAgent:
     def __init__(self):
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'between', 'among', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-            'could', 'can', 'may', 'might', 'must', 'this', 'that', 'these', 'those', 'i',
-            'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my',
-            'your', 'his', 'her', 'its', 'our', 'their'
-        }
+        self.stop_words = STOP_WORDS
     
     def summarize_headlines(self, headlines: List[Dict]) -> Dict:
         if not headlines:
@@ -24,10 +34,11 @@ class SummarizerAgent:
             }
         
         titles = [headline['title'] for headline in headlines]
+        lowered_titles = [title.lower() for title in titles]
         sources = [headline.get('source', 'Unknown') for headline in headlines]
         
-        key_topics = self._extract_key_topics(titles)
-        summary = self._generate_summary(titles, key_topics)
+        key_topics = self._extract_key_topics(lowered_titles)
+        summary = self._generate_summary(lowered_titles, key_topics)
         source_counts = Counter(sources)
         
         result = {
@@ -41,28 +52,25 @@ class SummarizerAgent:
         print(f"✓ Summarized {len(headlines)} headlines into key insights")
         return result
     
-    def _extract_key_topics(self, titles: List[str]) -> List[str]:
+    def _extract_key_topics(self, lowered_titles: List[str]) -> List[str]:
         all_words = []
         
-        for title in titles:
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
+        for title in lowered_titles:
+            words = WORD_PATTERN.findall(title)
             filtered_words = [word for word in words if word not in self.stop_words]
             all_words.extend(filtered_words)
         
         word_counts = Counter(all_words)
         return [word.title() for word, count in word_counts.most_common(15) if count > 1]
     
-    def _generate_summary(self, titles: List[str], key_topics: List[str]) -> str:
-        total = len(titles)
+    def _generate_summary(self, lowered_titles: List[str], key_topics: List[str]) -> str:
+        total = len(lowered_titles)
         
-        if not titles:
+        if not lowered_titles:
             return "No headlines available for summary."
         
-        tech_keywords = ['ai', 'tech', 'software', 'app', 'data', 'api', 'cloud', 'startup']
-        business_keywords = ['company', 'market', 'stock', 'investment', 'business', 'ceo']
-        
-        tech_count = sum(1 for title in titles if any(kw in title.lower() for kw in tech_keywords))
-        business_count = sum(1 for title in titles if any(kw in title.lower() for kw in business_keywords))
+        tech_count = sum(1 for title in lowered_titles if TECH_PATTERN.search(title))
+        business_count = sum(1 for title in lowered_titles if BUSINESS_PATTERN.search(title))
         
         summary_parts = [
             f"Analyzed {total} headlines from news sources."
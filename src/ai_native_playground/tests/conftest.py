@@ -0,0 +1,15 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def make_mock_get():
+    """Patch httpx.AsyncClient.get to return one response yielding the given JSON payloads in order."""
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        def _make(payloads):
+            mock_response = MagicMock()
+            mock_response.raise_for_status.return_value = None
+            mock_response.json.side_effect = list(payloads)
+            mock_get.return_value = mock_response
+            return mock_get
+        yield _make
@@ -0,0 +1,75 @@
+import threading
+import time
+import pytest
+from unittest.mock import call, patch
+from urllib.parse import urlparse
+from ai_native_playground.news_analyzer import news_orchestrator
+from ai_native_playground.news_analyzer.news_agent import NewsAgent
+from ai_native_playground.news_analyzer.news_orchestrator import NewsOrchestrator
+
+HN_FRONT = "https://news.ycombinator.com/news"
+HN_NEWEST = "https://news.ycombinator.com/newest"
+REDDIT_PYTHON = "https://www.reddit.com/r/python"
+REDDIT_RUST = "https://www.reddit.com/r/rust"
+
+@pytest.fixture
+def mock_sleep():
+    with patch.object(news_orchestrator, "time") as mock_time:
+        yield mock_time.sleep
+
+def fake_fetch_headlines(failing_sources=()):
+    def fetch_headlines(self, max_headlines=10):
+        if self.base_url in failing_sources:
+            return []  # NewsAgent swallows request errors and returns no headlines
+        return [{'title': f"{self.base_url} story {i}", 'url': '', 'source': self.base_url}
+                for i in range(max_headlines)]
+    return fetch_headlines
+
+class TestNewsOrchestrator:
+
+    def test_headlines_follow_source_order(self, mock_sleep):
+        sources = [HN_FRONT, REDDIT_PYTHON, HN_NEWEST, REDDIT_RUST]
+        with patch.object(NewsAgent, "fetch_headlines", fake_fetch_headlines()):
+            result = NewsOrchestrator().run_news_analysis(sources, max_headlines=2)
+
+        assert [h['source'] for h in result['headlines']] == [
+            HN_FRONT, HN_FRONT, REDDIT_PYTHON, REDDIT_PYTHON,
+            HN_NEWEST, HN_NEWEST, REDDIT_RUST, REDDIT_RUST,
+        ]
+
+    def test_repeated_source_is_fetched_each_time(self, mock_sleep):
+        with patch.object(NewsAgent, "fetch_headlines", fake_fetch_headlines()):
+            result = NewsOrchestrator().run_news_analysis([HN_FRONT, HN_FRONT], max_headlines=1)
+
+        assert [h['source'] for h in result['headlines']] == [HN_FRONT, HN_FRONT]
+
+    def test_failing_source_does_not_affect_others(self, mock_sleep):
+        sources = [HN_FRONT, REDDIT_PYTHON, HN_NEWEST]
+        fetch = fake_fetch_headlines(failing_sources={REDDIT_PYTHON})
+        with patch.object(NewsAgent, "fetch_headlines", fetch):
+            result = NewsOrchestrator().run_news_analysis(sources, max_headlines=1)
+
+        assert [h['source'] for h in result['headlines']] == [HN_FRONT, HN_NEWEST]
+
+    def test_same_host_fetches_are_serialized_and_spaced(self, mock_sleep):
+        lock = threading.Lock()
+        active = {}
+        max_active = {}
+        fetch = fake_fetch_headlines()
+
+        def tracking_fetch(self, max_headlines=10):
+            host = urlparse(self.base_url).netloc
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                max_active[host] = max(max_active.get(host, 0), active[host])
+            time.sleep(0.05)
+            with lock:
+                active[host] -= 1
+            return fetch(self, max_headlines)
+
+        sources = [HN_FRONT, REDDIT_PYTHON, HN_NEWEST, REDDIT_RUST]
+        with patch.object(NewsAgent, "fetch_headlines", tracking_fetch):
+            NewsOrchestrator().run_news_analysis(sources, max_headlines=1)
+
+        assert max_active == {"news.ycombinator.com": 1, "www.reddit.com": 1}
+        assert mock_sleep.call_args_list == [call(1), call(1)]
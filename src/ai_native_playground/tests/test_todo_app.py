@@ -0,0 +1,39 @@
+import json
+import pytest
+from ai_native_playground.todo_app import TodoApp
+
+@pytest.fixture
+def todo_app(tmp_path):
+    return TodoApp(filename=str(tmp_path / "todos.json"))
+
+class TestTodoApp:
+
+    def test_delete_todo(self, todo_app):
+        todo_app.add_todo("first")
+        todo_app.add_todo("second")
+
+        todo_app.delete_todo(1)
+
+        assert [todo["task"] for todo in todo_app.todos] == ["second"]
+        with open(todo_app.filename) as f:
+            assert json.load(f) == todo_app.todos
+
+    def test_delete_missing_todo(self, todo_app, capsys):
+        todo_app.add_todo("first")
+
+        todo_app.delete_todo(42)
+
+        assert len(todo_app.todos) == 1
+        assert "Todo #42 not found." in capsys.readouterr().out
+
+    def test_delete_removes_only_first_matching_todo(self, tmp_path):
+        filename = tmp_path / "todos.json"
+        filename.write_text(json.dumps([
+            {"id": 7, "task": "a", "completed": False},
+            {"id": 7, "task": "b", "completed": False},
+        ]))
+        todo_app = TodoApp(filename=str(filename))
+
+        todo_app.delete_todo(7)
+
+        assert [todo["task"] for todo in todo_app.todos] == ["b"]
@@ -1,10 +1,13 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 import os
 from main import app
 
-client = TestClient(app)
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
 
 @pytest.fixture
 def mock_geocoding_response():
@@ -78,20 +81,8 @@ def mock_onecall_forecast_response():
 class TestWeatherAPI:
     
     @patch.dict(os.environ, {"OPENWEATHER_API_KEY": "test_api_key"})
-    @patch("httpx.AsyncClient.get")
-    def test_current_weather_success(self, mock_get, mock_geocoding_response, mock_onecall_current_response):
-        mock_response = AsyncMock()
-        mock_get.return_value = mock_response
-        mock_response.raise_for_status.return_value = None
-        
-        mock_get.side_effect = [
-            mock_response,  # geocoding call
-            mock_response   # onecall call
-        ]
-        mock_response.json.side_effect = [
-            mock_geocoding_response,
-            mock_onecall_current_response
-        ]
+    def test_current_weather_success(self, client, make_mock_get, mock_geocoding_response, mock_onecall_current_response):
+        make_mock_get([mock_geocoding_response, mock_onecall_current_response])
         
         response = client.get("/current?city=Kanhangad")
         
@@ -109,20 +100,8 @@ class TestWeatherAPI:
         assert data["uv_index"] == 6.5
 
     @patch.dict(os.environ, {"OPENWEATHER_API_KEY": "test_api_key"})
-    @patch("httpx.AsyncClient.get")
-    def test_forecast_weather_success(self, mock_get, mock_geocoding_response, mock_onecall_forecast_response):
-        mock_response = AsyncMock()
-        mock_get.return_value = mock_response
-        mock_response.raise_for_status.return_value = None
-        
-        mock_get.side_effect = [
-            mock_response,  # geocoding call
-            mock_response   # onecall call
-        ]
-        mock_response.json.side_effect = [
-            mock_geocoding_response,
-            mock_onecall_forecast_response
-        ]
+    def test_forecast_weather_success(self, client, make_mock_get, mock_geocoding_response, mock_onecall_forecast_response):
+        make_mock_get([mock_geocoding_response, mock_onecall_forecast_response])
         
         response = client.get("/forecast?city=Kanhangad")
         
@@ -138,33 +117,29 @@ class TestWeatherAPI:
         assert data["forecast"][0]["pressure"] == 1015
         assert data["forecast"][0]["wind_speed"] == 4.2
 
-    def test_current_weather_missing_city(self):
+    def test_current_weather_missing_city(self, client):
         response = client.get("/current")
         assert response.status_code == 422
 
-    def test_forecast_weather_missing_city(self):
+    def test_forecast_weather_missing_city(self, client):
         response = client.get("/forecast")
         assert response.status_code == 422
 
     @patch.dict(os.environ, {"OPENWEATHER_API_KEY": ""})
-    def test_missing_api_key(self):
+    def test_missing_api_key(self, client):
         response = client.get("/current?city=Kanhangad")
         assert response.status_code == 500
         assert "API key not configured" in response.json()["detail"]
 
     @patch.dict(os.environ, {"OPENWEATHER_API_KEY": "test_api_key"})
-    @patch("httpx.AsyncClient.get")
-    def test_city_not_found(self, mock_get):
-        mock_response = AsyncMock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_city_not_found(self, client, make_mock_get):
+        make_mock_get([[]])
         
         response = client.get("/current?city=InvalidCity")
         assert response.status_code == 404
         assert "City not found" in response.json()["detail"]
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         response = client.get("/")
         assert response.status_code == 200
         assert "Weather API" in response.json()["message"]
\ No newline at end of file
@@ -1,13 +1,21 @@
 import os
+from datetime import datetime
 from fastapi import FastAPI, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
 import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = FastAPI(title="Weather API", description="Weather data from OpenWeatherMap", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.http_client = httpx.AsyncClient()
+    yield
+    await app.state.http_client.aclose()
+
+app = FastAPI(title="Weather API", description="Weather data from OpenWeatherMap", version="1.0.0", lifespan=lifespan)
 
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 OPENWEATHER_BASE_URL = "http://api.openweathermap.org/data/2.5"
@@ -51,22 +59,22 @@ async def get_coordinates(city: str) -> tuple[float, float]:
         "appid": OPENWEATHER_API_KEY
     }
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{GEOCODING_BASE_URL}/direct", params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data:
-                raise HTTPException(status_code=404, detail="City not found")
-            
-            return data[0]["lat"], data[0]["lon"]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail="City not found")
-            raise HTTPException(status_code=500, detail=f"Geocoding API error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise HTTPException(status_code=500, detail="Failed to connect to geocoding service")
+    client = app.state.http_client
+    try:
+        response = await client.get(f"{GEOCODING_BASE_URL}/direct", params=params)
+        response.raise_for_status()
+        data = response.json()
+        
+        if not data:
+            raise HTTPException(status_code=404, detail="City not found")
+        
+        return data[0]["lat"], data[0]["lon"]
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise HTTPException(status_code=404, detail="City not found")
+        raise HTTPException(status_code=500, detail=f"Geocoding API error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise HTTPException(status_code=500, detail="Failed to connect to geocoding service")
 
 async def fetch_onecall_data(lat: float, lon: float, exclude: str = "") -> Dict[str, Any]:
     if not OPENWEATHER_API_KEY:
@@ -82,15 +90,15 @@ async def fetch_onecall_data(lat: float, lon: float, exclude: str = "") -> Dict[
     if exclude:
         params["exclude"] = exclude
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(ONECALL_BASE_URL, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(status_code=500, detail=f"Weather API error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise HTTPException(status_code=500, detail="Failed to connect to weather service")
+    client = app.state.http_client
+    try:
+        response = await client.get(ONECALL_BASE_URL, params=params)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(status_code=500, detail=f"Weather API error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise HTTPException(status_code=500, detail="Failed to connect to weather service")
 
 @app.get("/current", response_model=WeatherResponse)
 async def get_current_weather(city: str = Query(..., description="City name")):
@@ -119,7 +127,6 @@ async def get_weather_forecast(city: str = Query(..., description="City name")):
     
     forecast_items = []
     for item in data["daily"]:
-        from datetime import datetime
         dt_str = datetime.fromtimestamp(item["dt"]).strftime("%Y-%m-%d %H:%M:%S")
         
         forecast_items.append(ForecastItem(